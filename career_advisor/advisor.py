@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import heapq
+import operator
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
-from models import Career, Competency, Profile
+from .models import Career, Competency, Profile, _norm
+
+_ANALYSIS_CACHE_SIZE = 128
+_NO_GAP_SUGGESTION = "Perfil já atende aos requisitos dessa carreira!"
+
+
+def _snapshot(profile: Profile) -> Mapping[str, float]:
+    return MappingProxyType(dict(profile._scores))
 
 
 @dataclass
@@ -15,7 +26,33 @@ class Recommendation:
     profile: Profile
     career: Career
     match_percentage: float
-    missing_competencies: Dict[str, float]
+    # Profile scores as of the analysis, so later edits to the profile cannot
+    # contradict ``match_percentage``.
+    _scores: Optional[Mapping[str, float]] = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self._scores is None:
+            self._scores = _snapshot(self.profile)
+
+    @cached_property
+    def missing_competencies(self) -> Dict[str, float]:
+        scores = self._scores
+        missing: Dict[str, float] = {}
+        for comp_name, required_score in self.career._items:
+            current_score = scores.get(comp_name, 0.0)
+            if current_score < required_score:
+                missing[comp_name] = required_score - current_score
+        return missing
+
+    @cached_property
+    def suggestions(self) -> Tuple[str, ...]:
+        suffix = self.career._suggestion_suffix
+        return tuple(
+            f"Aumentar {comp_name} em {missing_value:.1f}{suffix}"
+            for comp_name, missing_value in self.missing_competencies.items()
+        ) or (_NO_GAP_SUGGESTION,)
 
 
 class CareerAdvisor:
@@ -24,17 +61,25 @@ class CareerAdvisor:
     def __init__(self) -> None:
         self.profiles: Dict[str, Profile] = {}
         self.careers: Dict[str, Career] = {}
+        self._skill_index: Dict[str, int] = {}
+        self._required: List[Tuple[Tuple[int, ...], Tuple[float, ...]]] = []
+        self._career_order: Optional[List[Career]] = None
+        self._analysis_cache: Dict[
+            Tuple[int, int, Optional[int]], List[Recommendation]
+        ] = {}
 
     # -- Profiles -----------------------------------------------------------------
     def add_profile(self, profile: Profile) -> None:
-        self.profiles[profile.name.lower()] = profile
+        self.profiles[_norm(profile.name)] = profile
 
     def get_profile(self, name: str) -> Optional[Profile]:
-        return self.profiles.get(name.lower())
+        return self.profiles.get(_norm(name))
 
     # -- Careers ------------------------------------------------------------------
     def add_career(self, career: Career) -> None:
-        self.careers[career.name.lower()] = career
+        self.careers[_norm(career.name)] = career
+        self._career_order = None
+        self._analysis_cache.clear()
 
     def list_careers(self) -> List[Career]:
         return list(self.careers.values())
@@ -43,44 +88,116 @@ class CareerAdvisor:
     def add_competency_to_profile(
         self, profile_name: str, competency: Competency
     ) -> Profile:
-        profile = self.profiles.setdefault(profile_name.lower(), Profile(profile_name))
+        key = _norm(profile_name)
+        profile = self.profiles.get(key)
+        if profile is None:
+            profile = Profile(profile_name)
+            self.profiles[key] = profile
         profile.add_competency(competency)
         return profile
 
     # -- Analysis -----------------------------------------------------------------
-    def analyze_profile(self, profile: Profile) -> List[Recommendation]:
-        results: List[Recommendation] = []
-        for career in self.careers.values():
-            missing: Dict[str, float] = {}
-            total = 0
+    def _ensure_index(self) -> None:
+        """Rebuilds the scoring index if ``self.careers`` changed since last built."""
+
+        careers = list(self.careers.values())
+        order = self._career_order
+        if (
+            order is None
+            or len(order) != len(careers)
+            or not all(map(operator.is_, order, careers))
+        ):
+            self._build_index(careers)
+            self._analysis_cache.clear()
+
+    def _build_index(self, careers: List[Career]) -> None:
+        """Indexes the skills required by ``careers`` for scoring."""
+
+        skill_index: Dict[str, int] = {}
+        required: List[Tuple[Tuple[int, ...], Tuple[float, ...]]] = []
+        for career in careers:
+            indices = tuple(
+                skill_index.setdefault(comp_name, len(skill_index))
+                for comp_name, _ in career._items
+            )
+            required.append((indices, tuple(score for _, score in career._items)))
+        self._skill_index = skill_index
+        self._required = required
+        self._career_order = careers
+
+    def _score(self, scores: Mapping[str, float]) -> List[float]:
+        """Returns the match percentage of ``scores`` for each indexed career."""
+
+        skill_index = self._skill_index
+        profile_vec = [0.0] * len(skill_index)
+        for comp_name, score in scores.items():
+            index = skill_index.get(comp_name)
+            if index is not None:
+                profile_vec[index] = score
+
+        current = profile_vec.__getitem__
+        match: List[float] = []
+        for career, (indices, required_scores) in zip(
+            self._career_order, self._required
+        ):
+            # Sequential += like the original loop; sum() of floats is compensated
+            # on Python 3.12+ and would shift some rounded percentages.
             achieved = 0
-            for comp_name, kind, required_score in career.required_items():
-                total += required_score
-                current_score = profile.get_score(comp_name)
-                achieved += min(current_score, required_score)
-                if current_score < required_score:
-                    missing[comp_name] = required_score - current_score
-            match = (achieved / total * 100) if total else 0
-            results.append(
-                Recommendation(
-                    profile=profile,
-                    career=career,
-                    match_percentage=round(match, 2),
-                    missing_competencies=missing,
-                )
+            for value in map(min, map(current, indices), required_scores):
+                achieved += value
+            total = career._total
+            match.append(round(achieved / total * 100, 2) if total else 0)
+        return match
+
+    def score_profiles(self, profiles: Iterable[Profile]) -> List[List[float]]:
+        """Scores many profiles at once.
+
+        Each row holds the match percentages of one profile, in the same order
+        as :meth:`list_careers`.
+        """
+
+        self._ensure_index()
+        return [self._score(profile._scores) for profile in profiles]
+
+    def analyze_profile(
+        self, profile: Profile, top_k: Optional[int] = None
+    ) -> List[Recommendation]:
+        """Ranks careers for ``profile``, keeping only the best ``top_k`` if given."""
+
+        if top_k is not None and top_k < 0:
+            raise ValueError("top_k deve ser maior ou igual a zero.")
+        self._ensure_index()
+        # Cached recommendations keep a reference to their profile, so its id
+        # cannot be reused while the entry is alive.
+        key = (id(profile), profile._version, top_k)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        scores = _snapshot(profile)
+        match = self._score(scores)
+
+        positions = range(len(match))
+        if top_k is None:
+            order = sorted(positions, key=match.__getitem__, reverse=True)
+        else:
+            order = heapq.nlargest(top_k, positions, key=match.__getitem__)
+        results = [
+            Recommendation(
+                profile=profile,
+                career=self._career_order[position],
+                match_percentage=match[position],
+                _scores=scores,
             )
-        results.sort(key=lambda rec: rec.match_percentage, reverse=True)
-        return results
+            for position in order
+        ]
+        if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+            del self._analysis_cache[next(iter(self._analysis_cache))]
+        self._analysis_cache[key] = results
+        return list(results)
 
     def suggest_improvements(self, recommendation: Recommendation) -> List[str]:
-        suggestions: List[str] = []
-        for comp_name, missing_value in recommendation.missing_competencies.items():
-            suggestions.append(
-                f"Aumentar {comp_name} em {missing_value:.1f} pontos para a carreira de {recommendation.career.name}."
-            )
-        if not suggestions:
-            suggestions.append("Perfil já atende aos requisitos dessa carreira!")
-        return suggestions
+        return list(recommendation.suggestions)
 
 
 def build_default_advisor() -> CareerAdvisor:
@@ -195,7 +312,8 @@ def build_default_advisor() -> CareerAdvisor:
         "gestao de riscos": ("comportamental", 7),
         "pensamento empreendedor": ("comportamental", 7),
     }
-    skills_catalog = {**technical_skills, **behavioral_skills}
+    skills_catalog = technical_skills
+    skills_catalog.update(behavioral_skills)
 
     careers_data = [
         (
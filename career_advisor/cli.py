@@ -3,10 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from textwrap import dedent
 
-from advisor import CareerAdvisor, Recommendation, build_default_advisor
-from models import Competency, Profile
+from .advisor import CareerAdvisor, Recommendation, build_default_advisor
+from .models import Competency, Profile
+
+_TOP_K = 5
+
+_MENU_TEXT = dedent(
+    """
+    Escolha uma opção:
+    [1] Cadastrar perfil
+    [2] Adicionar competência ao perfil
+    [3] Analisar perfil e recomendar carreiras
+    [4] Mostrar carreiras disponíveis
+    [0] Sair
+    """
+)
+
+_DEMO_BANNER = dedent(
+    """
+    ========================= DEMONSTRAÇÃO =========================
+    Perfil exemplo: Marina
+    Competências: Python 7.5, Estatística 6, Comunicação 6.5
+    A seguir estão as recomendações geradas automaticamente.
+    =================================================================
+    """
+)
 
 
 class CareerCLI:
@@ -34,18 +58,7 @@ class CareerCLI:
                 print("Opção inválida. Tente novamente.\n")
 
     def _menu(self) -> str:
-        print(
-            dedent(
-                """
-                Escolha uma opção:
-                [1] Cadastrar perfil
-                [2] Adicionar competência ao perfil
-                [3] Analisar perfil e recomendar carreiras
-                [4] Mostrar carreiras disponíveis
-                [0] Sair
-                """
-            )
-        )
+        print(_MENU_TEXT)
         return input("Opção: ").strip()
 
     def _create_profile(self) -> None:
@@ -80,22 +93,24 @@ class CareerCLI:
         if not profile:
             print("Perfil não encontrado. Cadastre-o primeiro.")
             return
-        recommendations = self.advisor.analyze_profile(profile)
+        recommendations = self.advisor.analyze_profile(profile, top_k=_TOP_K)
         if not recommendations:
             print("Nenhuma carreira cadastrada para comparação.")
             return
         self._print_recommendations(recommendations)
 
     def _print_recommendations(self, recommendations: list[Recommendation]) -> None:
-        print("\nRecomendações:")
+        lines = ["\nRecomendações:"]
         for rec in recommendations:
-            print(
+            lines.append(
                 f"- {rec.career.name}: compatibilidade de {rec.match_percentage:.2f}%"
             )
-            suggestions = self.advisor.suggest_improvements(rec)
-            for suggestion in suggestions:
-                print(f"  * {suggestion}")
-        print()
+            lines.extend(
+                f"  * {suggestion}"
+                for suggestion in self.advisor.suggest_improvements(rec)
+            )
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _list_careers(self) -> None:
         print("Carreiras cadastradas:")
@@ -120,19 +135,9 @@ def demo() -> None:
     demo_profile.add_competency(Competency("Comunicacao", "comportamental", 6.5))
     advisor.add_profile(demo_profile)
 
-    print(
-        dedent(
-            """
-            ========================= DEMONSTRAÇÃO =========================
-            Perfil exemplo: Marina
-            Competências: Python 7.5, Estatística 6, Comunicação 6.5
-            A seguir estão as recomendações geradas automaticamente.
-            =================================================================
-            """
-        )
-    )
+    print(_DEMO_BANNER)
 
-    recommendations = advisor.analyze_profile(demo_profile)
+    recommendations = advisor.analyze_profile(demo_profile, top_k=_TOP_K)
     cli._print_recommendations(recommendations)
 
 
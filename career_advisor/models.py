@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Tuple
+from itertools import chain
+from typing import Dict, Iterable, Tuple
 
 
-@dataclass
+def _norm(name: str) -> str:
+    """Normalizes a name into the lowercase, interned key used by lookups."""
+
+    return sys.intern(name.strip().lower())
+
+
+_VALID_KINDS = frozenset(("tecnica", "comportamental"))
+
+
+@dataclass(slots=True)
 class Competency:
     """Represents a technical or behavioral competency."""
 
@@ -15,47 +26,98 @@ class Competency:
     score: float
 
     def __post_init__(self) -> None:
-        self.kind = self.kind.lower()
-        if self.kind not in {"tecnica", "comportamental"}:
-            raise ValueError(
-                "Tipo de competência deve ser 'tecnica' ou 'comportamental'."
-            )
+        self.name = _norm(self.name)
+        if self.kind not in _VALID_KINDS:
+            kind = self.kind.lower()
+            if kind not in _VALID_KINDS:
+                raise ValueError(
+                    "Tipo de competência deve ser 'tecnica' ou 'comportamental'."
+                )
+            self.kind = sys.intern(kind)
         if not 0 <= self.score <= 10:
             raise ValueError("A nota da competência deve estar entre 0 e 10.")
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
-    """Represents a professional profile with competencies."""
+    """Represents a professional profile with competencies.
+
+    Competencies must be added through :meth:`add_competency`; editing the skill
+    dicts directly after construction is not seen by :meth:`get_score` or by the
+    advisor's analysis cache.
+    """
 
     name: str
     technical_skills: Dict[str, Competency] = field(default_factory=dict)
     behavioral_skills: Dict[str, Competency] = field(default_factory=dict)
+    _scores: Dict[str, float] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Technical skills are applied last so they win on a name clash, as
+        # get_score always checked them first.
+        for bucket in (self.behavioral_skills, self.technical_skills):
+            for comp_name, competency in bucket.items():
+                self._scores[_norm(comp_name)] = competency.score
 
     def add_competency(self, competency: Competency) -> None:
         bucket = (
             self.technical_skills if competency.kind == "tecnica" else self.behavioral_skills
         )
-        bucket[competency.name.lower()] = competency
+        bucket[competency.name] = competency
+        # A technical score wins over a behavioral one with the same name.
+        technical = self.technical_skills
+        if bucket is technical or competency.name not in technical:
+            self._scores[competency.name] = competency.score
+        self._version += 1
 
-    def list_competencies(self) -> List[Competency]:
-        return list(self.technical_skills.values()) + list(self.behavioral_skills.values())
+    def list_competencies(self) -> Iterable[Competency]:
+        return chain(self.technical_skills.values(), self.behavioral_skills.values())
 
     def get_score(self, name: str) -> float:
-        key = name.lower()
-        if key in self.technical_skills:
-            return self.technical_skills[key].score
-        if key in self.behavioral_skills:
-            return self.behavioral_skills[key].score
-        return 0.0
+        return self._scores.get(_norm(name), 0.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class Career:
     """Represents a possible future career with required competencies."""
 
     name: str
     required_competencies: Dict[str, Tuple[str, float]]
+    _items: Tuple[Tuple[str, float], ...] = field(init=False, repr=False, compare=False)
+    _total: float = field(init=False, repr=False, compare=False)
+    _suggestion_suffix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self._cache_requirements():
+            self.required_competencies = {
+                _norm(comp_name): requirement
+                for comp_name, requirement in self.required_competencies.items()
+            }
+            self._cache_requirements()
+        self._suggestion_suffix = f" pontos para a carreira de {self.name}."
+
+    def _cache_requirements(self) -> bool:
+        """Caches ``_items`` and ``_total`` in a single pass.
+
+        Returns ``False``, caching nothing, as soon as a requirement key is not
+        already normalized.
+        """
+
+        items = []
+        # Sequential += rather than sum(): sum() of floats is compensated on
+        # Python 3.12+ and would shift some rounded match percentages.
+        total = 0
+        for comp_name, (_kind, score) in self.required_competencies.items():
+            if not comp_name.islower() or comp_name != comp_name.strip():
+                return False
+            items.append((comp_name, score))
+            total += score
+        self._items = tuple(items)
+        self._total = total
+        return True
 
     def required_items(self) -> Iterable[Tuple[str, str, float]]:
         for comp_name, (kind, score) in self.required_competencies.items():
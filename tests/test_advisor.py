@@ -0,0 +1,255 @@
+"""Behavior checks for the career advisor."""
+
+import random
+import unittest
+
+from career_advisor import (
+    Career,
+    CareerAdvisor,
+    Competency,
+    Profile,
+    Recommendation,
+)
+from career_advisor.advisor import build_default_advisor
+
+
+def _profile(name, **scores):
+    profile = Profile(name)
+    for skill, score in scores.items():
+        profile.add_competency(Competency(skill.replace("_", " "), "tecnica", score))
+    return profile
+
+
+class ScoreProfilesTest(unittest.TestCase):
+    def test_rows_follow_profiles_and_columns_follow_careers(self):
+        advisor = CareerAdvisor()
+        advisor.add_career(
+            Career("Dados", {"python": ("tecnica", 8), "sql": ("tecnica", 8)})
+        )
+        advisor.add_career(Career("Banco", {"sql": ("tecnica", 10)}))
+        profiles = [_profile("a", python=8), _profile("b", sql=5), Profile("c")]
+
+        matrix = advisor.score_profiles(profiles)
+
+        self.assertEqual(
+            [career.name for career in advisor.list_careers()], ["Dados", "Banco"]
+        )
+        self.assertEqual(matrix, [[50.0, 0.0], [31.25, 50.0], [0.0, 0.0]])
+
+    def test_rows_match_analyze_profile(self):
+        advisor = build_default_advisor()
+        profile = _profile("a", python=7.5, sql=6, power_bi=4.2)
+
+        [row] = advisor.score_profiles([profile])
+
+        by_career = {
+            rec.career.name: rec.match_percentage
+            for rec in advisor.analyze_profile(profile)
+        }
+        self.assertEqual(
+            row, [by_career[career.name] for career in advisor.list_careers()]
+        )
+
+
+class MatchPercentageTest(unittest.TestCase):
+    SKILLS = ["python", "sql", "comunicacao", "machine learning", "power bi"]
+
+    def _assert_matches_reference(self, advisor, profile):
+        for rec in advisor.analyze_profile(profile):
+            # Same sequential accumulation as the original implementation.
+            requirements = rec.career.required_competencies
+            achieved = 0
+            total = 0
+            for comp_name, (_kind, required) in requirements.items():
+                achieved += min(profile.get_score(comp_name), required)
+                total += required
+            self.assertEqual(rec.match_percentage, round(achieved / total * 100, 2))
+
+    def _advisor_with_random_careers(self, rng, draw_requirement):
+        advisor = build_default_advisor()
+        for index in range(30):
+            requirements = {
+                skill: ("tecnica", draw_requirement())
+                for skill in rng.sample(self.SKILLS, rng.randint(2, 5))
+            }
+            advisor.add_career(Career(f"Aleatoria {index}", requirements))
+        return advisor
+
+    def test_matches_exact_reference_for_arbitrary_scores(self):
+        rng = random.Random(0)
+        advisor = self._advisor_with_random_careers(
+            rng, lambda: round(rng.uniform(1, 10), 2)
+        )
+        for _ in range(500):
+            profile = Profile("p")
+            for skill in rng.sample(self.SKILLS, 3):
+                score = rng.choice([round(rng.uniform(0, 10), 2), rng.uniform(0, 10)])
+                profile.add_competency(Competency(skill, "tecnica", score))
+            self._assert_matches_reference(advisor, profile)
+
+    def test_matches_exact_reference_for_one_decimal_scores(self):
+        rng = random.Random(1)
+        advisor = self._advisor_with_random_careers(
+            rng, lambda: rng.randint(10, 100) / 10
+        )
+        for _ in range(2000):
+            profile = Profile("p")
+            for skill in rng.sample(self.SKILLS, rng.randint(1, 5)):
+                score = rng.randint(0, 100) / 10
+                profile.add_competency(Competency(skill, "tecnica", score))
+            self._assert_matches_reference(advisor, profile)
+
+
+class ProfileTest(unittest.TestCase):
+    def test_constructor_buckets_are_scored(self):
+        profile = Profile(
+            "x",
+            technical_skills={"python": Competency("python", "tecnica", 9)},
+            behavioral_skills={
+                "comunicacao": Competency("comunicacao", "comportamental", 5)
+            },
+        )
+
+        self.assertEqual(profile.get_score("Python"), 9)
+        self.assertEqual(profile.get_score("comunicacao"), 5)
+        top = build_default_advisor().analyze_profile(profile, top_k=1)[0]
+        self.assertEqual(top.match_percentage, 28.57)
+
+    def test_technical_score_wins_on_name_clash(self):
+        profile = Profile("x")
+        profile.add_competency(Competency("python", "tecnica", 9))
+        profile.add_competency(Competency("python", "comportamental", 2))
+        self.assertEqual(profile.get_score("python"), 9)
+
+        profile.add_competency(Competency("sql", "comportamental", 2))
+        profile.add_competency(Competency("sql", "tecnica", 7))
+        self.assertEqual(profile.get_score("sql"), 7)
+
+
+class CareerTest(unittest.TestCase):
+    def test_requirement_keys_are_normalized(self):
+        career = Career("Dados", {" Python ": ("tecnica", 8), "sql": ("tecnica", 6)})
+
+        self.assertEqual(list(career.required_competencies), ["python", "sql"])
+        self.assertEqual(career._items, (("python", 8), ("sql", 6)))
+
+    def test_normalized_requirements_are_kept_as_given(self):
+        requirements = {"python": ("tecnica", 8)}
+
+        self.assertIs(Career("Dados", requirements).required_competencies, requirements)
+
+
+class SkillIndexTest(unittest.TestCase):
+    def test_index_only_holds_skills_required_by_own_careers(self):
+        first = CareerAdvisor()
+        first.add_career(Career("Dados", {"python": ("tecnica", 8)}))
+        second = CareerAdvisor()
+        second.add_career(Career("Banco", {"sql": ("tecnica", 8)}))
+        profile = _profile("a", python=4, sql=2, cobol=9)
+
+        self.assertEqual(first.analyze_profile(profile)[0].match_percentage, 50.0)
+        self.assertEqual(second.analyze_profile(profile)[0].match_percentage, 25.0)
+        self.assertEqual(set(first._skill_index), {"python"})
+        self.assertEqual(set(second._skill_index), {"sql"})
+
+
+class TopKTest(unittest.TestCase):
+    def test_top_k_is_head_of_full_ranking(self):
+        advisor = build_default_advisor()
+        profile = _profile("a", python=7.5, sql=6, comunicacao=6.5)
+
+        full = advisor.analyze_profile(profile)
+        for top_k in (0, 1, 5, len(full), len(full) + 3):
+            with self.subTest(top_k=top_k):
+                top = advisor.analyze_profile(profile, top_k=top_k)
+                self.assertEqual(
+                    [(rec.career.name, rec.match_percentage) for rec in top],
+                    [(rec.career.name, rec.match_percentage) for rec in full[:top_k]],
+                )
+
+    def test_negative_top_k_is_rejected(self):
+        advisor = build_default_advisor()
+        profile = _profile("a", python=7.5)
+
+        with self.assertRaises(ValueError):
+            advisor.analyze_profile(profile, top_k=-1)
+        self.assertEqual(len(advisor.analyze_profile(profile, top_k=1)), 1)
+
+
+class RecommendationTest(unittest.TestCase):
+    def test_gaps_reflect_scores_at_analysis_time(self):
+        advisor = CareerAdvisor()
+        advisor.add_career(Career("Dados", {"python": ("tecnica", 8)}))
+        profile = _profile("a", python=1)
+        [recommendation] = advisor.analyze_profile(profile)
+
+        profile.add_competency(Competency("python", "tecnica", 9))
+
+        self.assertEqual(recommendation.match_percentage, 12.5)
+        self.assertEqual(recommendation.missing_competencies, {"python": 7})
+        self.assertEqual(
+            advisor.suggest_improvements(recommendation),
+            ["Aumentar python em 7.0 pontos para a carreira de Dados."],
+        )
+
+    def test_score_snapshot_is_keyword_only(self):
+        career = Career("Dados", {"python": ("tecnica", 8)})
+        with self.assertRaises(TypeError):
+            Recommendation(_profile("a", python=1), career, 12.5, {"python": 7.0})
+
+    def test_suggest_improvements_returns_a_fresh_list(self):
+        advisor = CareerAdvisor()
+        advisor.add_career(Career("Dados", {"python": ("tecnica", 8)}))
+        profile = _profile("a", python=1)
+        [recommendation] = advisor.analyze_profile(profile)
+
+        advisor.suggest_improvements(recommendation).append("EXTRA")
+
+        [cached] = advisor.analyze_profile(profile)
+        self.assertEqual(
+            advisor.suggest_improvements(cached),
+            ["Aumentar python em 7.0 pontos para a carreira de Dados."],
+        )
+
+
+class AnalysisCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.advisor = CareerAdvisor()
+        self.advisor.add_career(Career("Dados", {"python": ("tecnica", 8)}))
+
+    def test_add_competency_invalidates_cache(self):
+        profile = _profile("a", python=2)
+        [recommendation] = self.advisor.analyze_profile(profile)
+        self.assertEqual(recommendation.match_percentage, 25.0)
+
+        profile.add_competency(Competency("python", "tecnica", 6))
+
+        [recommendation] = self.advisor.analyze_profile(profile)
+        self.assertEqual(recommendation.match_percentage, 75.0)
+
+    def test_add_career_invalidates_cache(self):
+        profile = _profile("a", sql=4)
+        self.assertEqual(self.advisor.analyze_profile(profile)[0].match_percentage, 0.0)
+
+        self.advisor.add_career(Career("Banco", {"sql": ("tecnica", 8)}))
+
+        recommendations = self.advisor.analyze_profile(profile)
+        self.assertEqual(recommendations[0].career.name, "Banco")
+        self.assertEqual(recommendations[0].match_percentage, 50.0)
+
+    def test_direct_edits_to_careers_are_picked_up(self):
+        profile = _profile("a", python=4, sql=4)
+        self.assertEqual(self.advisor.analyze_profile(profile)[0].career.name, "Dados")
+
+        self.advisor.careers["dados"] = Career("Dados", {"python": ("tecnica", 4)})
+        [recommendation] = self.advisor.analyze_profile(profile)
+        self.assertEqual(recommendation.match_percentage, 100.0)
+
+        self.advisor.careers["banco"] = Career("Banco", {"sql": ("tecnica", 2)})
+        del self.advisor.careers["dados"]
+        [recommendation] = self.advisor.analyze_profile(profile)
+        self.assertEqual(recommendation.career.name, "Banco")
+
+
+if __name__ == "__main__":
+    unittest.main()